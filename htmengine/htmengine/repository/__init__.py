@@ -36,13 +36,16 @@ from htmengine.repository.queries import (
   getCustomMetrics,
   getInstances,
   getInstanceStatusHistory,
+  getActiveMetrics,
   getAllMetrics,
   getAllMetricsForServer,
+  getErrorMetrics,
   getAllModels,
   getMetric,
   getMetricWithSharedLock,
   getMetricWithUpdateLock,
   getMetricCountForServer,
+  getMetricStatusCounts,
   getMetricData,
   getMetricDataCount,
   getProcessedMetricDataCount,
@@ -342,6 +342,28 @@ def getMetricCountForServer(conn, server):
 
 
 
+def getMetricStatusCounts(conn):
+  """Get the number of metrics in each status.
+
+  The counting is performed server-side via GROUP BY, so only the aggregates
+  travel over the wire.
+
+  :param conn: SQLAlchemy connection object
+  :type conn: sqlalchemy.engine.base.Connection
+
+  :returns: mapping of metric status (one of the MetricStatus values present
+    in the metric table) to the number of metrics in that status
+  :rtype: dict
+  """
+  sel = (select([schema.metric.c.status,
+                 func.count(schema.metric.c.uid)])
+         .group_by(schema.metric.c.status))
+  result = conn.execute(sel)
+
+  return dict(result.fetchall())
+
+
+
 def _getMetrics(conn, fields=None, where=None):
   """Get all metrics currently in the db that satisfy the given parameters.
 
@@ -375,6 +397,34 @@ def getAllModels(conn, fields=None):
 
 
 
+def getActiveMetrics(conn, fields=None):
+  """Get all metrics in ACTIVE status; the status filtering is performed by
+  the database, so only matching rows travel over the wire.
+
+  :param conn: SQLAlchemy connection object
+  :type conn: sqlalchemy.engine.base.Connection
+  :param fields: Sequence of columns to be returned by underlying query
+  :rtype: sqlalchemy.engine.ResultProxy
+  """
+  where = schema.metric.c.status == MetricStatus.ACTIVE
+  return _getMetrics(conn, fields=fields, where=where)
+
+
+
+def getErrorMetrics(conn, fields=None):
+  """Get all metrics in ERROR status; the status filtering is performed by
+  the database, so only matching rows travel over the wire.
+
+  :param conn: SQLAlchemy connection object
+  :type conn: sqlalchemy.engine.base.Connection
+  :param fields: Sequence of columns to be returned by underlying query
+  :rtype: sqlalchemy.engine.ResultProxy
+  """
+  where = schema.metric.c.status == MetricStatus.ERROR
+  return _getMetrics(conn, fields=fields, where=where)
+
+
+
 def getMetricIdsSortedByDisplayValue(conn, period):
   """ Get Metric IDs in order of anomalous behavior over a given time period
 
@@ -26,8 +26,12 @@ the mysql taurus.metric table. Return non-zero result code if errors are found.
 """
 
 import argparse
+import collections
+import itertools
 import json
 import logging
+import multiprocessing.pool
+import os
 import sys
 
 import boto.dynamodb2.table
@@ -50,6 +54,83 @@ g_log = logging.getLogger(__name__)
 
 
 
+# Metric attributes consumed by the consistency checks; passed to the DynamoDB
+# scan as a projection so that only these attributes are returned over the wire
+_DYNAMODB_METRIC_ATTRIBUTES = (
+  "uid",
+  "name",
+  "display_name",
+  "metricType",
+  "metricTypeName",
+  "symbol",
+)
+
+
+# Engine metric record materialized from a repository metric row; attribute
+# access on these records is much cheaper than RowProxy item lookup in the
+# check loops. userInfo holds the pre-parsed metricSpec userInfo dict from the
+# parameters JSON blob for ACTIVE models (None for others), so the attribute
+# parity check doesn't re-run json.loads per model.
+EngineMetric = collections.namedtuple(
+  "EngineMetric",
+  "uid status name server parameters message userInfo"
+)
+
+
+# Number of segments for the parallel DynamoDB scan; each segment is scanned
+# by its own worker thread, so wall-clock scan time drops roughly linearly
+# with the segment count until throughput-provisioned. Overridable via the
+# TAURUS_DYNAMODB_SCAN_SEGMENTS environment variable.
+_DYNAMODB_SCAN_SEGMENTS = int(
+  os.environ.get("TAURUS_DYNAMODB_SCAN_SEGMENTS", 4))
+
+
+# Cached DynamoDB connection, created lazily by _getDynamodbConnection and
+# reused across invocations of checkAndReport so that repeated runs in a
+# long-lived process don't pay for a fresh TCP+TLS handshake each time
+_dynamodbConnection = None
+
+
+
+def _getDynamodbConnection():
+  """Get the shared DynamoDB connection, connecting on first use
+
+  boto HTTP keep-alive only takes effect when the same connection object is
+  reused across requests; the cached connection is also shared by the
+  parallel scan workers (boto connections are thread-safe for independent
+  requests).
+
+  :returns: DynamoDB connection
+  :rtype: boto.dynamodb2.layer1.DynamoDBConnection
+  """
+  global _dynamodbConnection  # pylint: disable=W0603
+
+  if _dynamodbConnection is None:
+    _dynamodbConnection = dynamodb_service.DynamoDBService.connectDynamoDB()
+
+  return _dynamodbConnection
+
+
+
+class _LazyReportDetails(object):
+  """Defers building a multi-line report-details string until the logging
+  subsystem actually formats the record; when the record is filtered by log
+  level, __str__ is never invoked and no string is built.
+  """
+
+  def __init__(self, linesFactory):
+    """
+    :param linesFactory: argumentless callable returning an iterable of the
+      individual report lines
+    """
+    self._linesFactory = linesFactory
+
+
+  def __str__(self):
+    return "\n".join(self._linesFactory())
+
+
+
 def _parseArgs(args):
   """Parse command-line arguments
 
@@ -80,44 +161,64 @@ def _parseArgs(args):
 
 
 
-def _getMetricsFromDynamodb(verbose):
-  """Retrieve metrics from dynamodb
+def _scanDynamodbMetricSegment(metricTable, segment):
+  """Scan one segment of the dynamodb metric table
 
-  :param bool verbose: True for verbose mode
+  :param metricTable: proxy of the dynamodb metric table
+  :type metricTable: boto.dynamodb2.table.Table
+
+  :param int segment: zero-based segment ordinal for the parallel scan
+
+  :returns: metric records from the given segment as a tuple of dicts
+  """
+  resultSet = retryOnTransientDynamoDBError(g_log)(metricTable.scan)(
+    segment=segment,
+    total_segments=_DYNAMODB_SCAN_SEGMENTS,
+    attributes=_DYNAMODB_METRIC_ATTRIBUTES)
+  return tuple(resultSet)
+
+
+
+def _getMetricsFromDynamodb():
+  """Retrieve metrics from dynamodb via a parallel segmented scan
 
   :returns: sequence of metric records as dicts
   """
-  # Connect to DynamoDB and create a proxy of the metric table
+  # Create a proxy of the metric table on the shared DynamoDB connection
   metricTable = boto.dynamodb2.table.Table(
     table_name=MetricDynamoDBDefinition().tableName,
-    connection = dynamodb_service.DynamoDBService.connectDynamoDB()
+    connection = _getDynamodbConnection()
   )
 
-  if verbose:
+  if g_log.isEnabledFor(logging.INFO):
     g_log.info("Accessing metrics in DynamodDB from %s via %r",
                metricTable.table_name, metricTable.connection)
 
-  resultSet = retryOnTransientDynamoDBError(g_log)(metricTable.scan)()
-  return tuple(resultSet)
+  pool = multiprocessing.pool.ThreadPool(processes=_DYNAMODB_SCAN_SEGMENTS)
+  try:
+    segmentResults = pool.map(
+      lambda segment: _scanDynamodbMetricSegment(metricTable, segment),
+      xrange(_DYNAMODB_SCAN_SEGMENTS))
+  finally:
+    pool.close()
+    pool.join()
 
+  return tuple(itertools.chain.from_iterable(segmentResults))
 
 
-def _checkFailedModels(engineMetrics,
-                       verbose):  # pylint: disable=W0613
-  """Check if any models are in error state
 
-  :param engineMetrics: metric rows from Taurus Engine's respository
-  :type engineMetrics: sequence of sqlalchemy.engine.RowProxy
+def _checkFailedModels(errorModels):
+  """Check if any models are in error state
 
-  :param bool verbose: True for verbose mode
+  :param errorModels: metric records from Taurus Engine's respository whose
+    status is MetricStatus.ERROR
+  :type errorModels: sequence of EngineMetric
 
   :returns: a two-tuple (warnings, errors), where each of the elements is a
     sequence of two-tuples (caption, details)
   """
   warnings = []
 
-  errorModels = tuple(obj for obj in engineMetrics
-                      if obj["status"] == MetricStatus.ERROR)
   if errorModels:
     # It's a warning as far as this check is concerned. If the model failed
     # during creation, we don't expect it to be in dynamodb.
@@ -125,10 +226,10 @@ def _checkFailedModels(engineMetrics,
       (
         "{} models in ERROR state".format(len(errorModels)),
 
-        "\n".join(
+        _LazyReportDetails(lambda: (
           "WARNING - model in error state: {}".format(
-            [str(obj["uid"]), str(obj["name"]), str(obj["message"])])
-          for obj in errorModels)
+            [str(obj.uid), str(obj.name), str(obj.message)])
+          for obj in errorModels))
       )
     )
 
@@ -136,37 +237,31 @@ def _checkFailedModels(engineMetrics,
 
 
 
-def _checkModelParity(engineMetrics,
-                      dynamodbMetrics,
-                      verbose):  # pylint: disable=W0613
+def _checkModelParity(activeModelsMap, dynamodbMetrics):
   """Verify that active models exist in DynamoDB
 
-  :param engineMetrics: metric rows from Taurus Engine's respository
-  :type engineMetrics: sequence of sqlalchemy.engine.RowProxy
+  :param activeModelsMap: metric records from Taurus Engine's respository
+    whose status is MetricStatus.ACTIVE, keyed by metric uid
+  :type activeModelsMap: dict of EngineMetric
 
   :param dynamodbMetrics: metric rows from Taurus Engine's dynamodb
     taurs.metric.<environment> table
   :type dynamodbMetrics: sequence of dict objects
 
-  :param bool verbose: True for verbose mode
-
   :returns: a two-tuple (warnings, errors), where each of the elements is a
     sequence of two-tuples (caption, details)
   """
   errors = []
 
-  activeModelsMap = {
-    obj["uid"] : obj
-    for obj in engineMetrics if obj["status"] == MetricStatus.ACTIVE
-  }
-
   dynamodbModelsMap = {
     obj["uid"] : obj
     for obj in dynamodbMetrics
   }
 
-  # Check if any active models are not in dynamodb
-  inRepositoryButNotInDynamodb = set(activeModelsMap) - set(dynamodbModelsMap)
+  # Check if any active models are not in dynamodb; dict key views support
+  # set operations without materializing intermediate sets
+  inRepositoryButNotInDynamodb = (activeModelsMap.viewkeys() -
+                                  dynamodbModelsMap.viewkeys())
 
   if inRepositoryButNotInDynamodb:
     errors.append(
@@ -174,17 +269,18 @@ def _checkModelParity(engineMetrics,
         ("There are {} active models in Taurus Engine repository that are "
          "not in DynamoDB").format(len(inRepositoryButNotInDynamodb)),
 
-        "\n".join(
+        _LazyReportDetails(lambda: (
           "ERROR - model not in DynamoDB: {}".format(
-            [str(uid), str(activeModelsMap[uid]["name"])])
-          for uid in inRepositoryButNotInDynamodb)
+            [str(uid), str(activeModelsMap[uid].name)])
+          for uid in inRepositoryButNotInDynamodb))
       )
     )
 
 
   # Check if any models are in dynamodb, but not among active models in Taurus
   # Engine's repository
-  inDynamodbButNotInRepository = set(dynamodbModelsMap) - set(activeModelsMap)
+  inDynamodbButNotInRepository = (dynamodbModelsMap.viewkeys() -
+                                  activeModelsMap.viewkeys())
 
   if inDynamodbButNotInRepository:
     errors.append(
@@ -193,10 +289,10 @@ def _checkModelParity(engineMetrics,
          "models in Taurus Engine repository").format(
            len(inDynamodbButNotInRepository)),
 
-        "\n".join(
+        _LazyReportDetails(lambda: (
           "ERROR - model UID not in Taurus Engine repository: {}".format(
             [str(uid), str(dynamodbModelsMap[uid]["name"])])
-          for uid in inDynamodbButNotInRepository)
+          for uid in inDynamodbButNotInRepository))
       )
     )
 
@@ -204,89 +300,93 @@ def _checkModelParity(engineMetrics,
 
 
 
-def _checkModelAttributeParity(engineMetrics,
-                               dynamodbMetrics,
-                               verbose):  # pylint: disable=W0613
+# Attribute comparisons performed by _checkModelAttributeParity: each entry
+# pairs the reported field name with an extractor returning the
+# (engine, dynamodb) values to compare; adding a field is a one-line change
+_FIELD_COMPARATORS = (
+  ("name",
+   lambda active, dynamodb: (active.name, dynamodb["name"])),
+
+  ("display_name",
+   lambda active, dynamodb: (active.server, dynamodb["display_name"])),
+
+  ("metricType",
+   lambda active, dynamodb: (active.userInfo["metricType"],
+                             dynamodb["metricType"])),
+
+  ("metricTypeName",
+   lambda active, dynamodb: (active.userInfo["metricTypeName"],
+                             dynamodb["metricTypeName"])),
+
+  ("symbol",
+   lambda active, dynamodb: (active.userInfo["symbol"],
+                             dynamodb["symbol"])),
+)
+
+
+
+def _checkModelAttributeParity(activeModelsMap, dynamodbMetrics):
   """Check attribute consistency between active models in DynamoDB and Taurus
   Engine's repository
 
-  :param engineMetrics: metric rows from Taurus Engine's respository
-  :type engineMetrics: sequence of sqlalchemy.engine.RowProxy
+  :param activeModelsMap: metric records from Taurus Engine's respository
+    whose status is MetricStatus.ACTIVE, keyed by metric uid
+  :type activeModelsMap: dict of EngineMetric
 
   :param dynamodbMetrics: metric rows from Taurus Engine's dynamodb
     taurs.metric.<environment> table
   :type dynamodbMetrics: sequence of dict objects
 
-  :param bool verbose: True for verbose mode
-
   :returns: a two-tuple (warnings, errors), where each of the elements is a
     sequence of two-tuples (caption, details)
   """
   errors = []
 
-  activeModelsMap = {
-    obj["uid"] : obj
-    for obj in engineMetrics if obj["status"] == MetricStatus.ACTIVE
-  }
+  # Only rows whose uid is also among the active models are ever compared;
+  # skip stale DynamoDB rows up front instead of carrying them in the map
+  # (_checkModelParity reports them as orphans)
+  activeUids = activeModelsMap.viewkeys()
 
   dynamodbModelsMap = {
     obj["uid"] : obj
-    for obj in dynamodbMetrics
+    for obj in dynamodbMetrics if obj["uid"] in activeUids
   }
 
-  commonMetricIds = set(dynamodbModelsMap) & set(activeModelsMap)
-
   mismatches = []
 
-  for uid in commonMetricIds:
+  for uid, dynamodbModel in dynamodbModelsMap.iteritems():
     diffs = []
 
     activeModel = activeModelsMap[uid]
-    dynamodbModel = dynamodbModelsMap[uid]
-
-    if activeModel["name"] != dynamodbModel["name"]:
-      diffs.append(("name",
-                    activeModel["name"],
-                    dynamodbModel["name"]))
-
-    if activeModel["server"] != dynamodbModel["display_name"]:
-      diffs.append(("display_name",
-                    activeModel["server"],
-                    dynamodbModel["display_name"]))
 
-    activeModelConfig = json.loads(activeModel["parameters"])
-    activeModelUserInfo = activeModelConfig["metricSpec"]["userInfo"]
-
-    if activeModelUserInfo["metricType"] != dynamodbModel["metricType"]:
-      diffs.append(("metricType",
-                    activeModelUserInfo["metricType"],
-                    dynamodbModel["metricType"]))
-
-    if activeModelUserInfo["metricTypeName"] != dynamodbModel["metricTypeName"]:
-      diffs.append(("metricTypeName",
-                    activeModelUserInfo["metricTypeName"],
-                    dynamodbModel["metricTypeName"]))
-
-    if activeModelUserInfo["symbol"] != dynamodbModel["symbol"]:
-      diffs.append(("symbol",
-                    activeModelUserInfo["symbol"],
-                    dynamodbModel["symbol"]))
+    # One uniform comparison loop over the comparator table instead of a
+    # hand-written if-block per field
+    for field, extractor in _FIELD_COMPARATORS:
+      engineValue, dynamodbValue = extractor(activeModel, dynamodbModel)
+      if engineValue != dynamodbValue:
+        diffs.append((field, engineValue, dynamodbValue))
 
     if diffs:
       mismatches.append((uid, diffs))
 
 
   if mismatches:
+    def formatMismatchLines():
+      # %-formatting reprs the diff tuples directly; the old format() call
+      # copied every diff into a tuple of str() values first, allocating
+      # a throwaway list of tuples per mismatched model
+      lines = [None] * len(mismatches)
+      for i, (uid, diffs) in enumerate(mismatches):
+        lines[i] = ("ERROR - model %s has attribute mismatch in Engine vs "
+                    "DynamoDB: %s" % (uid, diffs))
+      return lines
+
     errors.append(
       (
         ("{} models have attribute mismatch between Taurus Engine "
          "repository and DynamoDB").format(len(mismatches)),
 
-        "\n".join("ERROR - model {!s} has attribute mismatch in Engine vs "
-                  "DynamoDB: {}".format(
-                    uid,
-                    [tuple(str(item) for item in diff) for diff in diffs])
-                  for uid, diffs in mismatches)
+        _LazyReportDetails(formatMismatchLines)
       )
     )
 
@@ -294,110 +394,213 @@ def _checkModelAttributeParity(engineMetrics,
 
 
 
-def _runAllChecks(engineMetrics, dynamodbMetrics, verbose):
+def _runAllChecks(activeModelsMap,
+                  errorModels,
+                  statusCounts,
+                  dynamodbMetrics):
   """Perform all consistency checks
 
-  :param engineMetrics: metric rows from Taurus Engine's respository
-  :type engineMetrics: sequence of sqlalchemy.engine.RowProxy
+  :param activeModelsMap: metric records from Taurus Engine's respository
+    whose status is MetricStatus.ACTIVE, keyed by metric uid
+  :type activeModelsMap: dict of EngineMetric
+
+  :param errorModels: metric records from Taurus Engine's respository whose
+    status is MetricStatus.ERROR
+  :type errorModels: sequence of EngineMetric
+
+  :param statusCounts: per-status counts of the metric rows in Taurus
+    Engine's repository
+  :type statusCounts: collections.Counter
 
   :param dynamodbMetrics: metric rows from Taurus Engine's dynamodb
     taurs.metric.<environment> table
   :type dynamodbMetrics: sequence of dict objects
 
-  :param bool verbose: True for verbose mode
-
   :returns: a two-tuple (warnings, errors), where each of the elements is a
     sequence of two-tuples (caption, details)
   """
-  allWarnings = []
-  allErrors = []
-
-  if verbose:
+  # Gate the verbose bookkeeping on the effective log level rather than a
+  # plumbed-through flag; when INFO is filtered, the bookkeeping is skipped
+  if g_log.isEnabledFor(logging.INFO):
     g_log.info("There are %s metrics in Taurus Engine repository",
-               len(engineMetrics))
+               sum(statusCounts.itervalues()))
 
     g_log.info("There are %s metrics in DynamoDB",
                len(dynamodbMetrics))
 
     g_log.info("There are %s actively-monitored models (ACTIVE)",
-               sum(1 for obj in engineMetrics
-                   if obj["status"] == MetricStatus.ACTIVE))
+               len(activeModelsMap))
 
-    unmonitoredModels = tuple(obj for obj in engineMetrics
-                              if obj["status"] == MetricStatus.UNMONITORED)
-    if unmonitoredModels:
+    if statusCounts[MetricStatus.UNMONITORED]:
       g_log.info("There are %s metrics that are not monitored (UNMONITORED)",
-                 len(unmonitoredModels))
+                 statusCounts[MetricStatus.UNMONITORED])
 
-    createPendingModels = tuple(obj for obj in engineMetrics
-                                if obj["status"] == MetricStatus.CREATE_PENDING)
-    if createPendingModels:
+    if statusCounts[MetricStatus.CREATE_PENDING]:
       g_log.info("There are %s models that are create-pending (CREATE_PENDING)",
-                 len(createPendingModels))
+                 statusCounts[MetricStatus.CREATE_PENDING])
 
-    pendingDataModels = tuple(obj for obj in engineMetrics
-                              if obj["status"] == MetricStatus.PENDING_DATA)
-    if pendingDataModels:
+    if statusCounts[MetricStatus.PENDING_DATA]:
       g_log.info("There are %s models that are pending-data (PENDING_DATA)",
-                 len(pendingDataModels))
+                 statusCounts[MetricStatus.PENDING_DATA])
 
 
   # Check if any models are in error state
-  warnings, errors = _checkFailedModels(engineMetrics=engineMetrics,
-                                        verbose=verbose)
-  allWarnings += warnings
-  allErrors += errors
-
+  failedWarnings, failedErrors = _checkFailedModels(errorModels=errorModels)
 
   # Verify that active models exist in DynamoDB
-  warnings, errors = _checkModelParity(
-    engineMetrics=engineMetrics,
-    dynamodbMetrics=dynamodbMetrics,
-    verbose=verbose)
-
-  allWarnings += warnings
-  allErrors += errors
-
+  parityWarnings, parityErrors = _checkModelParity(
+    activeModelsMap=activeModelsMap,
+    dynamodbMetrics=dynamodbMetrics)
 
   # Verify attribute consistency between active models in DynamoDB and Taurus
-  # Engine's repository
-  warnings, errors = _checkModelAttributeParity(engineMetrics=engineMetrics,
-                                                dynamodbMetrics=dynamodbMetrics,
-                                                verbose=verbose)
+  # Engine's repository; without active models there are no common uids to
+  # compare, so the pass is guaranteed to produce nothing
+  if activeModelsMap:
+    attributeWarnings, attributeErrors = _checkModelAttributeParity(
+      activeModelsMap=activeModelsMap,
+      dynamodbMetrics=dynamodbMetrics)
+  else:
+    attributeWarnings = attributeErrors = ()
 
-  allWarnings += warnings
-  allErrors += errors
+  # Materialize the combined results once, instead of copying each check's
+  # lists into accumulators as they arrive
+  allWarnings = list(itertools.chain(failedWarnings,
+                                     parityWarnings,
+                                     attributeWarnings))
 
+  allErrors = list(itertools.chain(failedErrors,
+                                   parityErrors,
+                                   attributeErrors))
 
   return allWarnings, allErrors
 
 
 
-def checkAndReport(verbose, warningsAsErrors):
+def _isRepositoryEmpty(sqlEngine):
+  """Check whether the engine's repository contains any metric rows
+
+  The probe fetches at most a single row, so it costs one lightweight query;
+  checkAndReport uses it to skip the DynamoDB scan entirely on an empty
+  repository.
+
+  :param sqlEngine: SQLAlchemy engine for Taurus Engine's repository
+  :type sqlEngine: sqlalchemy.engine.Engine
+
+  :returns: True if the repository's metric table has no rows
+  :rtype: bool
+  """
+  with sqlEngine.connect() as conn:  # pylint: disable=E1101
+    firstRow = repository.getAllMetrics(conn).first()
+
+  return firstRow is None
+
+
+
+def _fetchEngineMetrics(sqlEngine):
+  """Fetch metric rows from the engine's repository and bucket them
+
+  The status filtering is pushed into the SQL queries, so only the ACTIVE
+  and ERROR rows that the checks actually consume travel over the wire and
+  are materialized into EngineMetric records. The repository connection's
+  lifecycle is owned entirely by this function, so it's safe to invoke from
+  a worker thread.
+
+  :param sqlEngine: SQLAlchemy engine for Taurus Engine's repository
+  :type sqlEngine: sqlalchemy.engine.Engine
+
+  :returns: a three-tuple (activeModelsMap, errorModels, statusCounts), where
+    activeModelsMap is a dict of ACTIVE EngineMetric records keyed by metric
+    uid, errorModels is a sequence of ERROR EngineMetric records, and
+    statusCounts is a collections.Counter of all metric statuses;
+    statusCounts feeds only the verbose summary and is populated only when
+    the logger is enabled for INFO
+  """
+  activeModelsMap = {}
+  errorModels = []
+
+  with sqlEngine.connect() as conn:  # pylint: disable=E1101
+    # The per-status tallies feed only the verbose summary; when it's
+    # enabled, have the repository aggregate them server-side via GROUP BY
+    # instead of tallying every row client-side
+    if g_log.isEnabledFor(logging.INFO):
+      statusCounts = collections.Counter(
+        repository.getMetricStatusCounts(conn))
+    else:
+      statusCounts = collections.Counter()
+
+    for row in repository.getActiveMetrics(conn):
+      activeModelsMap[row["uid"]] = EngineMetric(
+        uid=row["uid"],
+        status=row["status"],
+        name=row["name"],
+        server=row["server"],
+        parameters=row["parameters"],
+        message=row["message"],
+        userInfo=json.loads(row["parameters"])["metricSpec"]["userInfo"])
+
+    for row in repository.getErrorMetrics(conn):
+      errorModels.append(EngineMetric(uid=row["uid"],
+                                      status=row["status"],
+                                      name=row["name"],
+                                      server=row["server"],
+                                      parameters=row["parameters"],
+                                      message=row["message"],
+                                      userInfo=None))
+
+  return activeModelsMap, errorModels, statusCounts
+
+
+
+def checkAndReport(warningsAsErrors):
   """Run checks and report findings
 
-  :param bool verbose: True for verbose mode
+  Verbose bookkeeping throughout the checks is gated on the effective level
+  of this module's logger (INFO or lower enables it); see main(), which sets
+  the level from the --verbose command-line option.
+
   :param bool warningsAsErrors: True to treat warnings as errors, returning
     non-zero result code on warnings just as for errors.
 
   """
+  verbose = g_log.isEnabledFor(logging.INFO)
+
   # Read metric records from the engine's repository
   sqlEngine = repository.engineFactory()
   if verbose:
     g_log.info("Accessing Taurus Engine repository via %s", sqlEngine)
 
 
-  with sqlEngine.connect() as conn:  # pylint: disable=E1101
-    engineMetrics = repository.getAllMetrics(conn).fetchall()
+  # A fresh or drained repository has nothing to check; bail out before the
+  # DynamoDB scan so an idle deployment costs no DynamoDB round trip at all
+  if _isRepositoryEmpty(sqlEngine):
+    if verbose:
+      g_log.info("Taurus Engine repository has no metrics; nothing to check")
+    return 0
+
+
+  # The repository fetch and the dynamodb scan touch independent systems and
+  # are both I/O-bound, so overlap them; wall-clock time becomes the max of
+  # the two fetches instead of their sum
+  pool = multiprocessing.pool.ThreadPool(processes=2)
+  try:
+    engineMetricsResult = pool.apply_async(_fetchEngineMetrics, (sqlEngine,))
 
-  # Read metric records from the dynamodb taurs.metric.<environment> table
-  dynamodbMetrics = _getMetricsFromDynamodb(verbose=verbose)
+    dynamodbMetricsResult = pool.apply_async(_getMetricsFromDynamodb)
+
+    activeModelsMap, errorModels, statusCounts = engineMetricsResult.get()
+
+    # Read metric records from the dynamodb taurs.metric.<environment> table
+    dynamodbMetrics = dynamodbMetricsResult.get()
+  finally:
+    pool.close()
+    pool.join()
 
 
   # Perform all checks
-  warnings, errors = _runAllChecks(engineMetrics=engineMetrics,
-                                   dynamodbMetrics=dynamodbMetrics,
-                                   verbose=verbose)
+  warnings, errors = _runAllChecks(activeModelsMap=activeModelsMap,
+                                   errorModels=errorModels,
+                                   statusCounts=statusCounts,
+                                   dynamodbMetrics=dynamodbMetrics)
 
 
   # Report findings
@@ -442,9 +645,6 @@ def main(args=sys.argv[1:]):
   :param list args: The equivalent of `sys.argv[1:]`
   """
 
-  logging_support.LoggingSupport.initTool()
-
-
   try:
     args = _parseArgs(args)
   except SystemExit as exc:
@@ -454,9 +654,14 @@ def main(args=sys.argv[1:]):
 
     raise
 
+  # --verbose drives the effective logging level; the checks consult
+  # g_log.isEnabledFor(logging.INFO) instead of threading a verbose flag
+  # through every call
+  logging_support.LoggingSupport.initTool(
+    loggingLevel="INFO" if args.verbose else "WARNING")
+
 
-  return checkAndReport(verbose=args.verbose,
-                        warningsAsErrors=args.warningsAsErrors)
+  return checkAndReport(warningsAsErrors=args.warningsAsErrors)
 
 
 
@@ -39,13 +39,16 @@ from htmengine.repository import (addMetric,
                                   getCustomMetrics,
                                   getInstances,
                                   getInstanceStatusHistory,
+                                  getActiveMetrics,
                                   getAllMetrics,
                                   getAllMetricsForServer,
+                                  getErrorMetrics,
                                   getAllModels,
                                   getMetric,
                                   getMetricWithSharedLock,
                                   getMetricWithUpdateLock,
                                   getMetricCountForServer,
+                                  getMetricStatusCounts,
                                   getMetricData,
                                   getMetricDataCount,
                                   getProcessedMetricDataCount,
@@ -25,7 +25,9 @@
 # Suppress pylint warnings concerning access to protected member
 # pylint: disable=W0212
 
+from collections import Counter
 import copy
+import itertools
 import json
 import unittest
 
@@ -45,6 +47,48 @@ def setUpModule():
 
 
 
+def _makeEngineMetrics(rows):
+  """Materialize metric row dicts the way checkAndReport does
+
+  :param rows: sequence of metric row dicts
+  :returns: list of check_model_consistency.EngineMetric records
+  """
+  return [
+    check_model_consistency.EngineMetric(
+      userInfo=(
+        json.loads(row["parameters"])["metricSpec"]["userInfo"]
+        if row["status"] == MetricStatus.ACTIVE else None),
+      **row)
+    for row in rows
+  ]
+
+
+
+def _makeActiveModelsMap(engineMetrics):
+  """Build the active-models map that _runAllChecks feeds to the checks
+
+  :param engineMetrics: sequence of metric row dicts
+  :returns: dict of ACTIVE EngineMetric records keyed by metric uid
+  """
+  return {
+    obj.uid : obj
+    for obj in _makeEngineMetrics(engineMetrics)
+    if obj.status == MetricStatus.ACTIVE
+  }
+
+
+
+def _makeErrorModels(engineMetrics):
+  """Extract the error models that _runAllChecks feeds to _checkFailedModels
+
+  :param engineMetrics: sequence of metric row dicts
+  :returns: tuple of EngineMetric records whose status is MetricStatus.ERROR
+  """
+  return tuple(obj for obj in _makeEngineMetrics(engineMetrics)
+               if obj.status == MetricStatus.ERROR)
+
+
+
 # Parity between ACTIVE and dynamodb metrics; all metrics ACTIVE; no errors
 _PERFECT_PARITY_ALL_ACTIVE = dict(
   # We only mock the properties used by the functions under test
@@ -241,14 +285,17 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
 
     runAllChecksMock.return_value = ((), ())
 
-    result = check_model_consistency.checkAndReport(verbose=False,
-                                                    warningsAsErrors=False)
+    # Logger not configured for INFO corresponds to non-verbose operation
+    logMock.isEnabledFor.return_value = False
+
+    result = check_model_consistency.checkAndReport(warningsAsErrors=False)
     self.assertEqual(result, 0)
     self.assertEqual(logMock.handle.call_count, 0)
 
-    # Check again with verbose and warningsAsErrors turned on
-    result = check_model_consistency.checkAndReport(verbose=True,
-                                                    warningsAsErrors=True)
+    # Check again with verbose logging and warningsAsErrors turned on
+    logMock.isEnabledFor.return_value = True
+
+    result = check_model_consistency.checkAndReport(warningsAsErrors=True)
     self.assertEqual(result, 0)
 
     logMock.info.assert_any_call("Warnings: 0")
@@ -274,8 +321,9 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
 
     runAllChecksMock.return_value = (warnings, errors)
 
-    result = check_model_consistency.checkAndReport(verbose=False,
-                                                    warningsAsErrors=False)
+    logMock.isEnabledFor.return_value = False
+
+    result = check_model_consistency.checkAndReport(warningsAsErrors=False)
     self.assertEqual(result, 1)
 
     logMock.error.assert_any_call("Errors: %s", 2)
@@ -300,29 +348,60 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
 
     runAllChecksMock.return_value = (warnings, errors)
 
-    result = check_model_consistency.checkAndReport(verbose=False,
-                                                    warningsAsErrors=False)
+    logMock.isEnabledFor.return_value = False
+
+    result = check_model_consistency.checkAndReport(warningsAsErrors=False)
     self.assertEqual(result, 0)
 
     logMock.warn.assert_any_call("Warnings: %s", 2)
 
 
     # Check again with warningsAsErrors turned on
-    result = check_model_consistency.checkAndReport(verbose=False,
-                                                    warningsAsErrors=True)
+    result = check_model_consistency.checkAndReport(warningsAsErrors=True)
     self.assertEqual(result, 1)
 
 
+  @patch("taurus_engine.check_model_consistency.repository",
+         autospec=True)
+  @patch("taurus_engine.check_model_consistency._getMetricsFromDynamodb",
+         autospec=True)
+  @patch("taurus_engine.check_model_consistency._runAllChecks",
+         autospec=True)
+  @patch("taurus_engine.check_model_consistency.g_log",
+         autospec=True)
+  def testCheckAndReportWithEmptyRepository(self,
+                                            logMock,
+                                            runAllChecksMock,
+                                            _getMetricsFromDynamodbMock,
+                                            repositoryModuleMock,):
+
+    # Simulate an empty metric table; the probe fetches no first row
+    (repositoryModuleMock.getAllMetrics
+     .return_value.first.return_value) = None
+
+    logMock.isEnabledFor.return_value = False
+
+    result = check_model_consistency.checkAndReport(warningsAsErrors=True)
+    self.assertEqual(result, 0)
+
+    # The DynamoDB scan and the checks are skipped outright
+    self.assertEqual(_getMetricsFromDynamodbMock.call_count, 0)
+    self.assertEqual(runAllChecksMock.call_count, 0)
+
+
   def testRunAllChecksWithEmptyMetrics(self):
-    result = check_model_consistency._runAllChecks(engineMetrics=(),
-                                                   dynamodbMetrics=(),
-                                                   verbose=False)
+    result = check_model_consistency._runAllChecks(activeModelsMap={},
+                                                   errorModels=(),
+                                                   statusCounts=Counter(),
+                                                   dynamodbMetrics=())
     self.assertEqual(result, ([], []))
 
-    # Repeat with verbose=True
-    result = check_model_consistency._runAllChecks(engineMetrics=(),
-                                                   dynamodbMetrics=(),
-                                                   verbose=True)
+    # Repeat with INFO-level (verbose) logging enabled
+    with patch.object(check_model_consistency, "g_log", autospec=True):
+      result = check_model_consistency._runAllChecks(activeModelsMap={},
+                                                     errorModels=(),
+                                                     statusCounts=Counter(),
+                                                     dynamodbMetrics=())
     self.assertEqual(result, ([], []))
 
 
@@ -365,9 +444,11 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
       checkFailedModelssMock.return_value[1]
     )
 
-    warnings, errors = check_model_consistency._runAllChecks(engineMetrics=(),
-                                                             dynamodbMetrics=(),
-                                                             verbose=False)
+    warnings, errors = check_model_consistency._runAllChecks(
+      activeModelsMap={"uid1": Mock()},
+      errorModels=(),
+      statusCounts=Counter(),
+      dynamodbMetrics=())
 
     self.assertItemsEqual(warnings, allExpectedWarnings)
     self.assertItemsEqual(errors, allExpectedErrors)
@@ -376,16 +457,16 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
   def testCheckModelAttributeParityWithoutErrors(self):
 
     result = check_model_consistency._checkModelAttributeParity(
-      engineMetrics=_ACTIVE_PARITY_WITH_ONE_ERROR_METRIC["engineMetrics"],
-      dynamodbMetrics=_ACTIVE_PARITY_WITH_ONE_ERROR_METRIC["dynamodbMetrics"],
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(
+        _ACTIVE_PARITY_WITH_ONE_ERROR_METRIC["engineMetrics"]),
+      dynamodbMetrics=_ACTIVE_PARITY_WITH_ONE_ERROR_METRIC["dynamodbMetrics"])
 
     self.assertEqual(result, ([], []))
 
     result = check_model_consistency._checkModelAttributeParity(
-      engineMetrics=_PERFECT_PARITY_ALL_ACTIVE["engineMetrics"],
-      dynamodbMetrics=_PERFECT_PARITY_ALL_ACTIVE["dynamodbMetrics"],
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(
+        _PERFECT_PARITY_ALL_ACTIVE["engineMetrics"]),
+      dynamodbMetrics=_PERFECT_PARITY_ALL_ACTIVE["dynamodbMetrics"])
 
     self.assertEqual(result, ([], []))
 
@@ -405,9 +486,8 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
 
 
     warnings, errors = check_model_consistency._checkModelAttributeParity(
-      engineMetrics=engineMetrics,
-      dynamodbMetrics=dynamodbMetrics,
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(engineMetrics),
+      dynamodbMetrics=dynamodbMetrics)
 
     self.assertEqual(warnings, [])
     self.assertEqual(len(errors), 1)
@@ -422,9 +502,8 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
     dynamodbMetrics[0]["name"] = "eeename"
 
     warnings, errors = check_model_consistency._checkModelAttributeParity(
-      engineMetrics=engineMetrics,
-      dynamodbMetrics=dynamodbMetrics,
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(engineMetrics),
+      dynamodbMetrics=dynamodbMetrics)
 
     self.assertEqual(warnings, [])
     self.assertEqual(len(errors), 1)
@@ -439,9 +518,8 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
     dynamodbMetrics[0]["display_name"] = "eeedisplay_name"
 
     warnings, errors = check_model_consistency._checkModelAttributeParity(
-      engineMetrics=engineMetrics,
-      dynamodbMetrics=dynamodbMetrics,
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(engineMetrics),
+      dynamodbMetrics=dynamodbMetrics)
 
     self.assertEqual(warnings, [])
     self.assertEqual(len(errors), 1)
@@ -457,9 +535,8 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
     dynamodbMetrics[0]["metricType"] = "eeemetricType"
 
     warnings, errors = check_model_consistency._checkModelAttributeParity(
-      engineMetrics=engineMetrics,
-      dynamodbMetrics=dynamodbMetrics,
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(engineMetrics),
+      dynamodbMetrics=dynamodbMetrics)
 
     self.assertEqual(warnings, [])
     self.assertEqual(len(errors), 1)
@@ -474,9 +551,8 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
     dynamodbMetrics[0]["metricTypeName"] = "eeemetricTypeName"
 
     warnings, errors = check_model_consistency._checkModelAttributeParity(
-      engineMetrics=engineMetrics,
-      dynamodbMetrics=dynamodbMetrics,
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(engineMetrics),
+      dynamodbMetrics=dynamodbMetrics)
 
     self.assertEqual(warnings, [])
     self.assertEqual(len(errors), 1)
@@ -491,9 +567,8 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
     dynamodbMetrics[0]["symbol"] = "eeesymbol"
 
     warnings, errors = check_model_consistency._checkModelAttributeParity(
-      engineMetrics=engineMetrics,
-      dynamodbMetrics=dynamodbMetrics,
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(engineMetrics),
+      dynamodbMetrics=dynamodbMetrics)
 
     self.assertEqual(warnings, [])
     self.assertEqual(len(errors), 1)
@@ -502,9 +577,9 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
   def testCheckModelParityWithoutErrors(self):
 
     result = check_model_consistency._checkModelParity(
-      engineMetrics=_ACTIVE_PARITY_WITH_ONE_ERROR_METRIC["engineMetrics"],
-      dynamodbMetrics=_ACTIVE_PARITY_WITH_ONE_ERROR_METRIC["dynamodbMetrics"],
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(
+        _ACTIVE_PARITY_WITH_ONE_ERROR_METRIC["engineMetrics"]),
+      dynamodbMetrics=_ACTIVE_PARITY_WITH_ONE_ERROR_METRIC["dynamodbMetrics"])
 
     self.assertEqual(result, ([], []))
 
@@ -559,9 +634,8 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
 
 
     warnings, errors = check_model_consistency._checkModelParity(
-      engineMetrics=engineMetrics,
-      dynamodbMetrics=dynamodbMetrics,
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(engineMetrics),
+      dynamodbMetrics=dynamodbMetrics)
 
     self.assertEqual(warnings, [])
     self.assertEqual(len(errors), 1)
@@ -610,9 +684,8 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
 
 
     warnings, errors = check_model_consistency._checkModelParity(
-      engineMetrics=engineMetrics,
-      dynamodbMetrics=dynamodbMetrics,
-      verbose=False)
+      activeModelsMap=_makeActiveModelsMap(engineMetrics),
+      dynamodbMetrics=dynamodbMetrics)
 
     self.assertEqual(warnings, [])
     self.assertEqual(len(errors), 1)
@@ -621,28 +694,30 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
   def testCheckFailedModelsWithoutFailedModels(self):
 
     result = check_model_consistency._checkFailedModels(
-      engineMetrics=_PERFECT_PARITY_ALL_ACTIVE["engineMetrics"],
-      verbose=False)
+      errorModels=_makeErrorModels(
+        _PERFECT_PARITY_ALL_ACTIVE["engineMetrics"]))
 
     self.assertEqual(result, ([], []))
 
     # Repeat with verbose=True
     result = check_model_consistency._checkFailedModels(
-      engineMetrics=_PERFECT_PARITY_ALL_ACTIVE["engineMetrics"],
-      verbose=True)
+      errorModels=_makeErrorModels(
+        _PERFECT_PARITY_ALL_ACTIVE["engineMetrics"]))
 
     self.assertEqual(result, ([], []))
 
 
   def testCheckFailedModelsWithFailedModel(self):
     warnings, errors = check_model_consistency._checkFailedModels(
-      engineMetrics=_ACTIVE_PARITY_WITH_ONE_ERROR_METRIC["engineMetrics"],
-      verbose=False)
+      errorModels=_makeErrorModels(
+        _ACTIVE_PARITY_WITH_ONE_ERROR_METRIC["engineMetrics"]))
 
     self.assertEqual(len(warnings), 1)
     self.assertEqual(errors, [])
 
 
+  @patch("taurus_engine.check_model_consistency._dynamodbConnection",
+         new=None)
   @patch("taurus_engine.check_model_consistency"
          ".dynamodb_service.DynamoDBService.connectDynamoDB",
          spec_set=dynamodb_service.DynamoDBService.connectDynamoDB)
@@ -652,15 +727,30 @@ class CheckModelConsitencyTestCase(unittest.TestCase):
                                  dynamoTableClassMock,
                                  _connectDynamoDBMock):
 
-    expectedResult = (Mock(), Mock(), Mock())
+    numSegments = check_model_consistency._DYNAMODB_SCAN_SEGMENTS
+
+    # One batch of metric records per scan segment
+    segmentBatches = tuple((Mock(), Mock(), Mock())
+                           for _ in xrange(numSegments))
+
+    expectedResult = tuple(itertools.chain.from_iterable(segmentBatches))
+
+    scannedSegments = []
+
+    def scan(segment, total_segments, attributes):  # pylint: disable=W0613
+      scannedSegments.append(segment)
+      return (obj for obj in segmentBatches[segment])
+
+    dynamoTableClassMock.return_value.scan = Mock(side_effect=scan,
+                                                  __name__="scan")
+    dynamoTableClassMock.return_value.table_name = "taurus.metric.mock"
+    dynamoTableClassMock.return_value.connection = Mock()
 
-    dynamoTableClassMock.return_value.scan = Mock(
-      return_value = (obj for obj in expectedResult),
-      __name__="scan")
+    result = check_model_consistency._getMetricsFromDynamodb()
 
-    result = check_model_consistency._getMetricsFromDynamodb(verbose=False)
+    self.assertItemsEqual(result, expectedResult)
 
-    self.assertEqual(result, expectedResult)
+    self.assertItemsEqual(scannedSegments, range(numSegments))
 
 
   def testParseArgsWithoutArgs(self):
@@ -56,9 +56,11 @@ class _SubclassMetaClassWatcher(ABCMeta):
     """
     subclass = ABCMeta.__new__(cls, name, bases, attr)
 
-    subclass.checks = [
+    # Store the surviving checks as an immutable tuple; checkAll iterates it
+    # directly and registerCheck rebinds rather than mutates
+    subclass.checks = tuple(
       check for check in subclass.checks if check in attr.values()
-    ]
+    )
 
     return subclass
 
@@ -69,7 +71,7 @@ class _SubclassMetaClassWatcher(ABCMeta):
 class MonitorDispatcher(object):
   __metaclass__ = _SubclassMetaClassWatcher
 
-  checks = []
+  checks = ()
 
 
 
@@ -238,6 +240,9 @@ class MonitorDispatcher(object):
   def checkAll(self):
     """ Run all previously-registered checks and send an email upon failure
     """
+    # Bind the dispatch method once, outside the loop
+    dispatchNotification = self.dispatchNotification
+
     for check in self.checks:
       # Disable `Catching too general exception Exception (broad-except)`
       # warning
@@ -245,10 +250,8 @@ class MonitorDispatcher(object):
       try:
         check(self)
       except Exception:
-        self.dispatchNotification(check,
-                                  sys.exc_type,
-                                  sys.exc_value,
-                                  sys.exc_traceback)
+        excType, excValue, excTraceback = sys.exc_info()
+        dispatchNotification(check, excType, excValue, excTraceback)
 
 
   @staticmethod
@@ -269,5 +272,5 @@ class MonitorDispatcher(object):
     check.  Function must be an instance method of a MonitorDispatcher subclass
     and accept no additional arguments.
     """
-    cls.checks.append(fn)
+    cls.checks += (fn,)
     return fn